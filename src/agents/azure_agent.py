@@ -4,13 +4,52 @@ This module contains the Azure-specific agent implementation with its
 configuration and tools.
 """
 
+import asyncio
+from typing import Any
+
+import orjson
 from openai import AsyncAzureOpenAI
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 
 from src.config.settings import settings
-from src.models.responses import QueryResponse
+from src.models.responses import QueryError, QueryResponse
+from src.utils.cache import semantic_cache
+from src.utils.http import get_http_client
 from src.utils.logging import logger, with_logging
+from src.utils.prompts import load_prompt
+from src.utils.usage import log_cache_usage
+from src.utils.warmup import warmup_once
+
+AZURE_OPENAI_API_VERSION = "2024-10-21"
+
+BATCH_ENDPOINT = "/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Loaded once with normalized whitespace so every request sends the same
+# minimal prompt. Azure OpenAI only caches prompts of at least 1,024 tokens,
+# so this short prompt is not served from its prompt cache.
+AZURE_SYSTEM_PROMPT = load_prompt("azure_system_prompt")
+
+
+def _batch_error_message(record: dict[str, Any]) -> str:
+    """Extract the error message from a failed Batch API output record.
+
+    Args:
+        record: Parsed line from a batch output or error file.
+
+    Returns:
+        str: The provider's error message, or the raw error payload if it has
+        no message.
+    """
+    error = record.get("error")
+    if not error:
+        body = (record.get("response") or {}).get("body") or {}
+        error = body.get("error", body) if isinstance(body, dict) else body
+    if isinstance(error, dict) and error.get("message"):
+        return error["message"]
+    return str(error)
 
 
 class AzureAgent:
@@ -29,8 +68,11 @@ class AzureAgent:
         """Initialize the Azure agent with OpenAI configuration."""
         self.client = AsyncAzureOpenAI(
             azure_endpoint=settings.azure_openai_endpoint,
-            api_version="2024-02-01-preview",
+            api_version=AZURE_OPENAI_API_VERSION,
             api_key=settings.azure_openai_api_key,
+            http_client=get_http_client(
+                settings.azure_openai_endpoint, AZURE_OPENAI_API_VERSION
+            ),
         )
 
         self.model = OpenAIModel(
@@ -39,23 +81,52 @@ class AzureAgent:
 
         self.agent = Agent(self.model)
         self._register_system_prompt()
+        self._warmed_up = False
+
+    @warmup_once("Azure OpenAI")
+    async def warmup(self) -> None:
+        """Open a connection to Azure OpenAI ahead of the first query.
+
+        Issues a cheap model listing so the TLS handshake is paid at startup.
+        """
+        await self.client.models.list()
 
     def _register_system_prompt(self) -> None:
         """Register the system prompt for the Azure agent."""
 
         @self.agent.system_prompt
         async def system_prompt() -> str:
-            return """
-            You are a specialized SQL query assistant for Azure SQL Database.
-            Your role is to execute queries safely and provide detailed explanations
-            of the results. Always validate queries before execution and ensure
-            they follow best practices.
-            """
+            return AZURE_SYSTEM_PROMPT
+
+    async def embed_query(self, query: str) -> list[float] | None:
+        """Embed a query for semantic response caching.
+
+        Args:
+            query: Normalized query text.
+
+        Returns:
+            list[float] | None: Query embedding, or None if no embedding
+            deployment is configured or the request fails.
+        """
+        if not settings.azure_openai_embedding_deployment:
+            return None
+        try:
+            response = await self.client.embeddings.create(
+                model=settings.azure_openai_embedding_deployment, input=query
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.error("Azure query embedding failed", error=e, query=query)
+            return None
 
     @with_logging
+    @semantic_cache(ttl=300, semantic=True)
     async def execute_query(self, query: str) -> QueryResponse:
         """Execute a query using the Azure OpenAI agent.
 
+        Responses are cached for five minutes and reused for identical or,
+        when an embedding deployment is configured, near-identical queries.
+
         Args:
             query: SQL query to execute.
 
@@ -68,10 +139,116 @@ class AzureAgent:
         try:
             logger.info("Executing Azure query", query=query)
             result = await self.agent.run(query)
+            log_cache_usage(result)
             return result.data
         except Exception as e:
             logger.error("Azure query execution failed", error=e, query=query)
             raise
 
+    @with_logging
+    async def execute_batch(
+        self,
+        queries: list[str],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+    ) -> list[str | QueryError]:
+        """Execute queries through the Azure OpenAI Batch API.
+
+        Batch jobs are billed at a discount and have separate rate limits, but
+        may take up to the completion window to finish, so this is only suited
+        to non-interactive workloads. Requests go to the Global-Batch
+        deployment named by ``settings.azure_openai_batch_deployment``.
+
+        Args:
+            queries: SQL queries to execute.
+            poll_interval: Initial delay in seconds between status checks.
+            max_poll_interval: Upper bound for the exponential polling delay.
+
+        Returns:
+            list[str | QueryError]: Model response or error for each query, in
+            the same order as ``queries``.
+
+        Raises:
+            RuntimeError: If no batch deployment is configured or the batch job
+                does not complete.
+        """
+        if not queries:
+            return []
+        deployment = settings.azure_openai_batch_deployment
+        if not deployment:
+            raise RuntimeError("azure_openai_batch_deployment is not configured")
+
+        requests = [
+            {
+                "custom_id": str(index),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": deployment,
+                    "messages": [
+                        {"role": "system", "content": AZURE_SYSTEM_PROMPT},
+                        {"role": "user", "content": query},
+                    ],
+                },
+            }
+            for index, query in enumerate(queries)
+        ]
+        payload = b"\n".join(orjson.dumps(request) for request in requests)
+
+        batch_file = await self.client.files.create(
+            file=("queries.jsonl", payload), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        logger.info("Submitted Azure batch", batch_id=batch.id, queries=len(queries))
+
+        delay = poll_interval
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            errors = batch.errors.data if batch.errors and batch.errors.data else []
+            details = "; ".join(str(error.message or error.code) for error in errors)
+            raise RuntimeError(
+                f"Azure batch {batch.id} ended with status {batch.status}"
+                + (f": {details}" if details else "")
+            )
+
+        lines: list[bytes] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.client.files.content(file_id)
+                lines.extend(content.content.splitlines())
+
+        results: list[str | QueryError] = [
+            QueryError(
+                error_message="No response returned by batch",
+                source="Azure OpenAI",
+                query=query,
+            )
+            for query in queries
+        ]
+        for line in lines:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                results[index] = QueryError(
+                    error_message=_batch_error_message(record),
+                    source="Azure OpenAI",
+                    query=queries[index],
+                )
+            else:
+                message = response["body"]["choices"][0]["message"]
+                results[index] = message["content"]
+        return results
+
 
 azure_agent = AzureAgent()
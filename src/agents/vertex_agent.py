@@ -9,7 +9,19 @@ from pydantic_ai.models.vertexai import VertexAIModel
 
 from src.config.settings import settings
 from src.models.responses import QueryResponse
+from src.utils.cache import semantic_cache
+from src.utils.http import get_http_client
 from src.utils.logging import logger, with_logging
+from src.utils.prompts import load_prompt
+from src.utils.usage import log_cache_usage
+from src.utils.warmup import warmup_once
+
+VERTEX_REGION = "us-central1"
+
+# Loaded once with normalized whitespace so every request sends the same
+# minimal prompt. Gemini 1.5 does not cache prompts implicitly; reuse would
+# need an explicit context cache, which this agent does not create.
+VERTEX_SYSTEM_PROMPT = load_prompt("vertex_system_prompt")
 
 
 class VertexAgent:
@@ -28,29 +40,38 @@ class VertexAgent:
         self.model = VertexAIModel(
             model="gemini-1.5-flash",
             project_id=settings.google_cloud_project,
-            region="us-central1",
+            region=VERTEX_REGION,
+            http_client=get_http_client(settings.google_cloud_project, VERTEX_REGION),
         )
 
         self.agent = Agent(self.model, result_type=QueryResponse)
 
         self._register_system_prompt()
+        self._warmed_up = False
+
+    @warmup_once("Vertex AI")
+    async def warmup(self) -> None:
+        """Fetch Vertex AI credentials ahead of the first query.
+
+        Resolves application default credentials and an access token at
+        startup.
+        """
+        await self.model.ainit()
 
     def _register_system_prompt(self) -> None:
         """Register the system prompt for the Vertex agent."""
 
         @self.agent.system_prompt
         async def system_prompt() -> str:
-            return """
-            You are a specialized SQL query assistant for Google BigQuery.
-            Your role is to execute queries efficiently and provide detailed
-            explanations of the results. Always validate queries before execution
-            and ensure they follow BigQuery best practices.
-            """
+            return VERTEX_SYSTEM_PROMPT
 
     @with_logging
+    @semantic_cache(ttl=300)
     async def execute_query(self, query: str) -> QueryResponse:
         """Execute a query using the Vertex agent.
 
+        Responses are cached for five minutes and reused for identical queries.
+
         Args:
             query: SQL query to execute.
 
@@ -63,6 +84,7 @@ class VertexAgent:
         try:
             logger.info("Executing Vertex query", query=query)
             result = await self.agent.run(query)
+            log_cache_usage(result)
             return result.data
         except Exception as e:
             logger.error("Vertex query execution failed", error=e, query=query)
@@ -4,62 +4,76 @@ This module contains all configuration settings and environment variable handlin
 for the multi-cloud agent application.
 """
 
-import os
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, cast
 
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-@dataclass
-class Settings:
+
+class Settings(BaseSettings):
     """Application settings and configuration.
 
+    Values are read from environment variables (or a ``.env`` file) matching the
+    upper-cased field names, validated and coerced once, and frozen.
+
     Attributes:
         azure_openai_deployment_name: Name of the Azure OpenAI deployment.
         azure_openai_api_key: API key for Azure OpenAI.
         azure_openai_endpoint: Endpoint URL for Azure OpenAI.
         azure_sql_connection_string: Connection string for Azure SQL Database.
         google_cloud_project: Google Cloud project ID.
+        azure_openai_embedding_deployment: Optional Azure OpenAI embedding
+            deployment used for semantic response caching.
+        azure_openai_batch_deployment: Optional Azure OpenAI Global-Batch
+            deployment used by ``AzureAgent.execute_batch``.
         log_level: Logging level (default: INFO).
+        azure_sql_pool_size: Maximum number of pooled Azure SQL connections.
+        httpx_max_connections: Maximum connections per shared HTTP client.
+        httpx_max_keepalive: Maximum idle keep-alive connections per shared
+            HTTP client.
+        max_concurrent_queries: Maximum multi-cloud queries run concurrently by
+            ``MultiCloudAgent.execute_many``.
     """
 
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
     azure_openai_deployment_name: str
     azure_openai_api_key: str
     azure_openai_endpoint: str
     azure_sql_connection_string: str
     google_cloud_project: str
+    azure_openai_embedding_deployment: str | None = None
+    azure_openai_batch_deployment: str | None = None
     log_level: str = "INFO"
+    azure_sql_pool_size: int = 10
+    httpx_max_connections: int = 100
+    httpx_max_keepalive: int = 50
+    max_concurrent_queries: int = 10
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load and cache the application settings.
+
+    Call ``get_settings.cache_clear()`` to force the environment to be re-read.
+
+    Returns:
+        Settings: Configured settings instance.
+
+    Raises:
+        pydantic.ValidationError: If required environment variables are missing
+            or invalid.
+    """
+    return Settings()
+
+
+class _SettingsProxy:
+    """Lazy view of the cached settings returned by ``get_settings``."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
 
-    @classmethod
-    def from_env(cls) -> "Settings":
-        """Create Settings instance from environment variables.
-
-        Returns:
-            Settings: Configured settings instance.
-
-        Raises:
-            ValueError: If required environment variables are missing.
-        """
-        required_vars = [
-            "AZURE_OPENAI_DEPLOYMENT_NAME",
-            "AZURE_OPENAI_API_KEY",
-            "AZURE_OPENAI_ENDPOINT",
-            "AZURE_SQL_CONNECTION_STRING",
-            "GOOGLE_CLOUD_PROJECT",
-        ]
-
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
-        if missing_vars:
-            raise ValueError(
-                f"Missing required environment variables: {', '.join(missing_vars)}"
-            )
-
-        return cls(
-            azure_openai_deployment_name=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-            azure_openai_api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            azure_openai_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            azure_sql_connection_string=os.getenv("AZURE_SQL_CONNECTION_STRING"),
-            google_cloud_project=os.getenv("GOOGLE_CLOUD_PROJECT"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-        )
-
-
-settings = Settings.from_env()
+settings = cast("Settings", _SettingsProxy())
@@ -6,15 +6,19 @@ multi-cloud agent application with comprehensive observability.
 
 import asyncio
 import time
+import uuid
 from dataclasses import dataclass
+from typing import Literal
 
 import logfire
 from logfire import span
 
 from .agents.azure_agent import azure_agent
 from .agents.vertex_agent import vertex_agent
+from .config.settings import settings
 from .models.responses import QueryError, QueryResponse
-from .utils.logging import logger, with_logging
+from .utils.http import aclose_http_clients
+from .utils.logging import logger, request_id, with_logging
 
 
 @dataclass
@@ -35,13 +39,19 @@ class MultiCloudQueryResult:
 class MultiCloudAgent:
     """Multi-cloud agent orchestrator with Logfire observability."""
 
+    def __init__(self) -> None:
+        """Initialize the orchestrator's concurrency limit from settings."""
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent_queries)
+
     @with_logging
-    @span("execute_multi_cloud_query")
     async def execute_query(
         self, query: str, azure_only: bool = False, vertex_only: bool = False
     ) -> MultiCloudQueryResult:
         """Execute query across specified cloud platforms with tracing.
 
+        The ``with_logging`` span covers the whole call, and only the provider
+        round-trips get a child span.
+
         Args:
             query: SQL query to execute.
             azure_only: Only execute on Azure SQL.
@@ -58,31 +68,111 @@ class MultiCloudAgent:
 
         start_time = time.time()
 
-        with logfire.span("prepare_query_tasks"):
-            tasks = []
-            if not vertex_only:
-                tasks.append(azure_agent.execute_query(query))
-            if not azure_only:
-                tasks.append(vertex_agent.execute_query(query))
+        tasks = []
+        if not vertex_only:
+            tasks.append(azure_agent.execute_query(query))
+        if not azure_only:
+            tasks.append(vertex_agent.execute_query(query))
+
+        with logfire.span(
+            "execute_queries",
+            query=query,
+            azure_enabled=not vertex_only,
+            vertex_enabled=not azure_only,
+        ):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        with logfire.span("execute_queries") as span:
-            span.set_attribute("query", query)
-            span.set_attribute("azure_enabled", not vertex_only)
-            span.set_attribute("vertex_enabled", not azure_only)
+        azure_result = results[0] if not vertex_only else None
+        vertex_result = results[-1] if not azure_only else None
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        execution_time = time.time() - start_time
+
+        return MultiCloudQueryResult(
+            azure_result=azure_result,
+            vertex_result=vertex_result,
+            execution_time=execution_time,
+        )
+
+    @with_logging
+    async def execute_many(
+        self, queries: list[str]
+    ) -> list[MultiCloudQueryResult | BaseException]:
+        """Execute several queries concurrently across both cloud platforms.
+
+        At most ``settings.max_concurrent_queries`` queries are in flight at
+        once, so the fan-out stays within provider rate limits and the shared
+        HTTP connection pools. Each query is logged under its own request ID.
+
+        Args:
+            queries: SQL queries to execute.
+
+        Returns:
+            list[MultiCloudQueryResult | BaseException]: Result or raised
+            exception for each query, in the same order as ``queries``.
+        """
+
+        async def execute_one(query: str) -> MultiCloudQueryResult:
+            # Each gathered task runs in a copy of the context, so this does
+            # not leak into sibling queries.
+            request_id.set(uuid.uuid4().hex)
+            async with self._semaphore:
+                return await self.execute_query(query)
 
-        with logfire.span("process_results"):
-            azure_result = results[0] if not vertex_only else None
-            vertex_result = results[-1] if not azure_only else None
+        return await asyncio.gather(
+            *(execute_one(query) for query in queries), return_exceptions=True
+        )
+
+    @with_logging
+    async def execute_query_batch(
+        self,
+        queries: list[str],
+        mode: Literal["interactive", "batch"] = "interactive",
+    ) -> list[MultiCloudQueryResult | BaseException]:
+        """Execute several queries across both cloud platforms.
+
+        In ``"batch"`` mode the Azure prompts are submitted together through the
+        Azure OpenAI Batch API, which is cheaper but may take hours to complete.
+        Vertex queries are always executed interactively, at most
+        ``settings.max_concurrent_queries`` at a time.
+
+        Args:
+            queries: SQL queries to execute.
+            mode: ``"interactive"`` for per-query calls, ``"batch"`` for
+                non-interactive workloads.
+
+        Returns:
+            list[MultiCloudQueryResult | BaseException]: Results in the same order
+            as ``queries``.
+        """
+        if mode == "interactive":
+            return await self.execute_many(queries)
 
-            execution_time = time.time() - start_time
+        async def execute_vertex(query: str) -> QueryResponse:
+            async with self._semaphore:
+                return await vertex_agent.execute_query(query)
 
-            return MultiCloudQueryResult(
+        start_time = time.time()
+
+        azure_results, *vertex_results = await asyncio.gather(
+            azure_agent.execute_batch(queries),
+            *(execute_vertex(query) for query in queries),
+            return_exceptions=True,
+        )
+        if isinstance(azure_results, BaseException):
+            azure_results = [azure_results] * len(queries)
+
+        execution_time = time.time() - start_time
+
+        return [
+            MultiCloudQueryResult(
                 azure_result=azure_result,
                 vertex_result=vertex_result,
                 execution_time=execution_time,
             )
+            for azure_result, vertex_result in zip(
+                azure_results, vertex_results, strict=True
+            )
+        ]
 
 
 multi_cloud_agent = MultiCloudAgent()
@@ -99,6 +189,9 @@ async def main():
     """
 
     try:
+        with logfire.span("warmup"):
+            await asyncio.gather(azure_agent.warmup(), vertex_agent.warmup())
+
         with logfire.span("execute_example_query"):
             result = await multi_cloud_agent.execute_query(query)
 
@@ -116,6 +209,8 @@ async def main():
     except Exception as e:
         logger.error("Multi-cloud query failed", error=e)
         raise
+    finally:
+        await aclose_http_clients()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from both Azure and Google Cloud services.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QueryResult(BaseModel):
@@ -20,6 +20,8 @@ class QueryResult(BaseModel):
         execution_time: Time taken to execute the query in seconds.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(..., description="The executed SQL query")
     result: list[Any] = Field(..., description="Query results")
     source: str = Field(..., description="Source system (Azure SQL or BigQuery)")
@@ -36,6 +38,8 @@ class QueryError(BaseModel):
         query: The query that caused the error (if available).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     error_message: str = Field(..., description="Error description")
     source: str = Field(..., description="Source system where error occurred")
     query: str | None = Field(None, description="Query that caused the error")
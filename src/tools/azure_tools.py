@@ -4,15 +4,162 @@ This module provides tools for executing queries against Azure SQL Database
 with proper connection management and error handling.
 """
 
+import asyncio
+import datetime
+import decimal
+import sys
 import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from itertools import repeat
+from typing import Any
 
+import pyarrow as pa
 import pyodbc
 
 from src.config.settings import settings
 from src.models.responses import QueryError, QueryResponse, QueryResult
 from src.utils.logging import logger, with_logging
 
+# Let the ODBC driver manager keep physical connections alive between uses.
+pyodbc.pooling = True
+
+# Rows fetched from the driver per round-trip when materializing results.
+FETCH_BATCH_SIZE = 10_000
+
+# Arrow types for the Python types pyodbc reports in ``cursor.description``.
+# pyodbc reports any other SQL type as ``str``.
+_ARROW_TYPES: dict[type, pa.DataType] = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    bytearray: pa.binary(),
+    datetime.datetime: pa.timestamp("us"),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64("us"),
+}
+
+# pyodbc calls block, so they run here instead of on the event loop. Sized to
+# the connection pool since each worker holds at most one connection.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.azure_sql_pool_size, thread_name_prefix="azure-sql"
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking pyodbc call on the Azure SQL thread pool.
+
+    Args:
+        func: Blocking callable to run.
+        *args: Positional arguments for the callable.
+
+    Returns:
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, func, *args)
+
+
+def _arrow_schema(description: tuple[tuple[Any, ...], ...]) -> pa.Schema:
+    """Build the Arrow schema of a result set from its cursor description.
+
+    Types come from the driver rather than the fetched values, so every batch
+    of a result shares one schema even when a chunk is entirely NULL.
+
+    Args:
+        description: ``cursor.description`` of an executed query.
+
+    Returns:
+        pa.Schema: One field per result column.
+    """
+    fields = []
+    for name, type_code, _, _, precision, scale, _ in description:
+        if type_code is decimal.Decimal:
+            arrow_type = pa.decimal128(precision or 38, scale or 0)
+        else:
+            arrow_type = _ARROW_TYPES.get(type_code, pa.string())
+        fields.append(pa.field(sys.intern(name), arrow_type))
+    return pa.schema(fields)
+
+
+def _rows_to_batch(rows: list[pyodbc.Row], schema: pa.Schema) -> pa.RecordBatch:
+    """Transpose fetched rows into an Arrow record batch.
+
+    Rows are transposed into one Arrow array per column, so column names are
+    stored once rather than repeated as keys on every row.
+
+    Args:
+        rows: Rows fetched from the cursor.
+        schema: Schema of the result set, from ``_arrow_schema``.
+
+    Returns:
+        pa.RecordBatch: The rows in columnar form.
+    """
+    column_values = list(zip(*rows, strict=True)) if rows else [()] * len(schema)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(values, type=field.type)
+            for values, field in zip(column_values, schema, strict=True)
+        ],
+        schema=schema,
+    )
+
+
+def _fetch_records(connection: pyodbc.Connection, query: str) -> list[dict[str, Any]]:
+    """Execute a query and return its rows as dictionaries on the calling thread.
+
+    Rows are fetched in chunks of ``FETCH_BATCH_SIZE`` and converted to
+    dictionaries as they arrive, so only one chunk of driver rows is held at a
+    time. Conversion runs through ``map`` so the per-row loop stays in C.
+
+    Args:
+        connection: Open database connection.
+        query: SQL query to execute.
+
+    Returns:
+        list[dict[str, Any]]: One dictionary per row, keyed by column name.
+    """
+    records: list[dict[str, Any]] = []
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query)
+        columns = [sys.intern(column[0]) for column in cursor.description]
+        while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+            records.extend(map(dict, map(zip, repeat(columns), rows)))
+    finally:
+        cursor.close()
+
+    return records
+
+
+def _run_query(connection: pyodbc.Connection, query: str) -> pa.Table:
+    """Execute a query and fetch all rows on the calling thread.
+
+    Rows are fetched in chunks of ``FETCH_BATCH_SIZE`` and converted to Arrow
+    as they arrive, so the full result set is never held as Python rows.
+
+    Args:
+        connection: Open database connection.
+        query: SQL query to execute.
+
+    Returns:
+        pa.Table: Query results in columnar form.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query)
+        schema = _arrow_schema(cursor.description)
+        batches = []
+        while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+            batches.append(_rows_to_batch(rows, schema))
+    finally:
+        cursor.close()
+
+    return pa.Table.from_batches(batches, schema=schema)
+
 
 class AzureSQLTools:
     """Tools for interacting with Azure SQL Database.
@@ -22,17 +169,38 @@ class AzureSQLTools:
 
     Attributes:
         connection_string: Azure SQL Database connection string.
-        connection_pool: Optional connection pool for query execution.
+        pool_size: Maximum number of open connections.
+        connection_pool: Idle connections available for reuse.
     """
 
     def __init__(self) -> None:
         """Initialize Azure SQL tools with connection settings."""
         self.connection_string = settings.azure_sql_connection_string
-        self.connection_pool: list[pyodbc.Connection] | None = None
+        self.pool_size = settings.azure_sql_pool_size
+        self.connection_pool: asyncio.Queue[pyodbc.Connection] = asyncio.Queue(
+            maxsize=self.pool_size
+        )
+        self._pool_slots = asyncio.Semaphore(self.pool_size)
+
+    def _close_connection(self, connection: pyodbc.Connection) -> None:
+        """Close a connection, logging rather than raising on failure.
+
+        Args:
+            connection: Connection to close.
+        """
+        try:
+            connection.close()
+        except Exception as e:
+            logger.error("Error closing Azure SQL connection", error=e)
 
     @asynccontextmanager
     async def get_connection(self):
-        """Async context manager for database connections.
+        """Async context manager for pooled database connections.
+
+        Idle connections are reused; a new one is opened only when the pool is
+        empty, and at most ``pool_size`` connections are checked out at once.
+        Connections are rolled back before being returned to the pool and are
+        closed instead if the caller raised.
 
         Yields:
             pyodbc.Connection: Database connection from the pool.
@@ -40,16 +208,100 @@ class AzureSQLTools:
         Raises:
             Exception: If connection cannot be established.
         """
-        connection = None
+        async with self._pool_slots:
+            try:
+                connection = self.connection_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                connection = await _run_blocking(
+                    pyodbc.connect, self.connection_string
+                )
+
+            try:
+                yield connection
+            except BaseException:
+                await _run_blocking(self._close_connection, connection)
+                raise
+
+            try:
+                await _run_blocking(connection.rollback)
+            except Exception as e:
+                logger.error("Error resetting Azure SQL connection", error=e)
+                await _run_blocking(self._close_connection, connection)
+            else:
+                self.connection_pool.put_nowait(connection)
+
+    async def close(self) -> None:
+        """Close all idle pooled connections."""
+        while not self.connection_pool.empty():
+            connection = self.connection_pool.get_nowait()
+            await _run_blocking(self._close_connection, connection)
+
+    async def stream_query(
+        self, query: str, batch_size: int = FETCH_BATCH_SIZE
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Execute a query and yield results as they are fetched.
+
+        The next ``fetchmany`` is started before each batch is yielded, so
+        consumers process one batch while the driver fetches the next. The
+        connection is held until the iterator is exhausted or closed. All
+        batches share the schema derived from the cursor description.
+
+        Args:
+            query: SQL query to execute.
+            batch_size: Maximum rows per yielded batch.
+
+        Yields:
+            pa.RecordBatch: Up to ``batch_size`` result rows in columnar form.
+
+        Raises:
+            Exception: If query execution fails.
+        """
         try:
-            connection = pyodbc.connect(self.connection_string)
-            yield connection
-        finally:
-            if connection:
+            async with self.get_connection() as conn:
+                cursor = await _run_blocking(conn.cursor)
+                pending_fetch = None
                 try:
-                    connection.close()
-                except Exception as e:
-                    logger.error("Error closing Azure SQL connection", error=e)
+                    await _run_blocking(cursor.execute, query)
+                    schema = _arrow_schema(cursor.description)
+                    pending_fetch = asyncio.create_task(
+                        _run_blocking(cursor.fetchmany, batch_size)
+                    )
+                    while rows := await pending_fetch:
+                        pending_fetch = asyncio.create_task(
+                            _run_blocking(cursor.fetchmany, batch_size)
+                        )
+                        yield await _run_blocking(_rows_to_batch, rows, schema)
+                finally:
+                    # Let an abandoned prefetch finish before closing its cursor.
+                    if pending_fetch is not None:
+                        await asyncio.gather(pending_fetch, return_exceptions=True)
+                    await _run_blocking(cursor.close)
+        except Exception as e:
+            logger.error("Azure SQL query execution failed", error=e, query=query)
+            raise
+
+    @with_logging
+    async def execute_query_arrow(self, query: str) -> pa.Table:
+        """Execute a query against Azure SQL Database and return columnar results.
+
+        Use this instead of ``execute_query`` when the caller can consume Arrow
+        directly and does not need per-row dictionaries.
+
+        Args:
+            query: SQL query to execute.
+
+        Returns:
+            pa.Table: Query results in columnar form.
+
+        Raises:
+            Exception: If query execution fails.
+        """
+        try:
+            async with self.get_connection() as conn:
+                return await _run_blocking(_run_query, conn, query)
+        except Exception as e:
+            logger.error("Azure SQL query execution failed", error=e, query=query)
+            raise
 
     @with_logging
     async def execute_query(self, query: str) -> QueryResponse:
@@ -65,25 +317,18 @@ class AzureSQLTools:
 
         try:
             async with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-
-                results = cursor.fetchall()
-                columns = [column[0] for column in cursor.description]
+                formatted_results = await _run_blocking(_fetch_records, conn, query)
 
-                formatted_results = [
-                    dict(zip(columns, row, strict=False)) for row in results
-                ]
+            execution_time = time.time() - start_time
 
-                execution_time = time.time() - start_time
-
-                return QueryResult(
-                    query=query,
-                    result=formatted_results,
-                    source="Azure SQL",
-                    explanation=f"Successfully executed query returning {len(formatted_results)} rows",
-                    execution_time=execution_time,
-                )
+            # Fields are built locally and already typed, so skip validation.
+            return QueryResult.model_construct(
+                query=query,
+                result=formatted_results,
+                source="Azure SQL",
+                explanation=f"Successfully executed query returning {len(formatted_results)} rows",
+                execution_time=execution_time,
+            )
 
         except Exception as e:
             logger.error("Azure SQL query execution failed", error=e, query=query)
@@ -4,10 +4,12 @@ This module provides tools for executing queries against Google BigQuery
 with proper client management and error handling.
 """
 
+import asyncio
 import time
 
-from google.api_core import retry
-from google.cloud import bigquery
+import pyarrow as pa
+from google.api_core import retry_async
+from google.cloud import bigquery, bigquery_storage
 
 from src.config.settings import settings
 from src.models.responses import QueryError, QueryResponse, QueryResult
@@ -22,29 +24,66 @@ class BigQueryTools:
 
     Attributes:
         client: BigQuery client instance.
+        bqstorage_client: Shared BigQuery Storage Read API client.
         project_id: Google Cloud project ID.
     """
 
     def __init__(self) -> None:
         """Initialize BigQuery tools with client configuration."""
         self.client = bigquery.Client(project=settings.google_cloud_project)
+        # Reused across queries so result downloads share one gRPC channel.
+        self.bqstorage_client = bigquery_storage.BigQueryReadClient()
         self.project_id = settings.google_cloud_project
 
-    @retry.Retry(predicate=retry.if_transient_error)
-    async def _execute_with_retry(self, query: str) -> bigquery.QueryJob:
+    @retry_async.AsyncRetry(
+        predicate=retry_async.if_transient_error,
+        initial=0.5,
+        maximum=8.0,
+        multiplier=2.0,
+    )
+    async def _execute_with_retry(self, query: str) -> pa.Table:
         """Execute BigQuery query with retry logic.
 
+        Transient API errors are retried with exponential backoff. Results are
+        downloaded as Arrow through the BigQuery Storage Read API. The job
+        submission and download block on I/O, so they run in a worker thread
+        to keep the event loop free.
+
+        Args:
+            query: SQL query to execute.
+
+        Returns:
+            pa.Table: Query results in columnar form.
+
+        Raises:
+            Exception: If query execution fails after retries.
+        """
+        query_job = await asyncio.to_thread(self.client.query, query)
+        return await asyncio.to_thread(
+            query_job.to_arrow, bqstorage_client=self.bqstorage_client
+        )
+
+    @with_logging
+    async def execute_query_arrow(self, query: str) -> pa.Table:
+        """Execute a query against BigQuery and return columnar results.
+
+        Use this instead of ``execute_query`` when the caller can consume Arrow
+        directly and does not need per-row dictionaries.
+
         Args:
             query: SQL query to execute.
 
         Returns:
-            bigquery.QueryJob: Completed query job.
+            pa.Table: Query results in columnar form.
 
         Raises:
             Exception: If query execution fails after retries.
         """
-        query_job = self.client.query(query)
-        return query_job.result()
+        try:
+            return await self._execute_with_retry(query)
+        except Exception as e:
+            logger.error("BigQuery query execution failed", error=e, query=query)
+            raise
 
     @with_logging
     async def execute_query(self, query: str) -> QueryResponse:
@@ -59,13 +98,14 @@ class BigQueryTools:
         start_time = time.time()
 
         try:
-            results = await self._execute_with_retry(query)
+            table = await self._execute_with_retry(query)
 
-            formatted_results = [dict(row.items()) for row in results]
+            formatted_results = await asyncio.to_thread(table.to_pylist)
 
             execution_time = time.time() - start_time
 
-            return QueryResult(
+            # Fields are built locally and already typed, so skip validation.
+            return QueryResult.model_construct(
                 query=query,
                 result=formatted_results,
                 source="BigQuery",
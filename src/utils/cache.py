@@ -0,0 +1,265 @@
+"""Response caching for agent query execution.
+
+This module provides a two-level cache for agent responses: an exact match on
+the normalized query text, followed by an optional semantic match on query
+embeddings for agents that opt in and can produce them.
+"""
+
+import functools
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.models.responses import QueryError
+from src.utils.logging import logger
+
+_WHITESPACE = re.compile(r"\s+")
+# Quoted strings (with '' escapes) and numbers in a query.
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups.
+
+    Case is preserved because SQL string literals are case-sensitive.
+
+    Args:
+        query: Raw query text.
+
+    Returns:
+        str: Query with collapsed whitespace.
+    """
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def split_literals(query: str) -> tuple[str, tuple[str, ...]]:
+    """Separate a query's string and numeric literals from its structure.
+
+    Embeddings barely move when only a literal changes, so semantic matches
+    compare the literal-free template and require the literals to be equal.
+
+    Args:
+        query: Normalized query text.
+
+    Returns:
+        tuple[str, tuple[str, ...]]: Query with each literal replaced by ``?``,
+        and the literals in order.
+    """
+    literals = tuple(_LITERALS.findall(query))
+    return _LITERALS.sub("?", query), literals
+
+
+def _unit_vector(embedding: Sequence[float]) -> tuple[float, ...]:
+    """Scale an embedding to unit length so dot products give cosine similarity.
+
+    Args:
+        embedding: Raw embedding vector.
+
+    Returns:
+        tuple[float, ...]: Unit-length copy of the embedding.
+    """
+    norm = math.sqrt(math.sumprod(embedding, embedding)) or 1.0
+    return tuple(value / norm for value in embedding)
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """Cached response with its expiry time and optional query embedding."""
+
+    namespace: str
+    expires_at: float
+    embedding: tuple[float, ...] | None
+    literals: tuple[str, ...]
+    response: Any
+
+
+class ResponseCache:
+    """In-memory TTL cache keyed on normalized queries and their embeddings.
+
+    Attributes:
+        ttl: Seconds a cached response stays valid.
+        maxsize: Maximum number of cached responses.
+        similarity_threshold: Minimum cosine similarity for a semantic hit.
+    """
+
+    def __init__(
+        self, ttl: float, maxsize: int = 256, similarity_threshold: float = 0.97
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a cached response stays valid.
+            maxsize: Maximum number of cached responses.
+            similarity_threshold: Minimum cosine similarity for a semantic hit.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries whose TTL has elapsed.
+
+        Args:
+            now: Current monotonic time.
+        """
+        expired = [
+            key for key, entry in self._entries.items() if entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response for an exact key.
+
+        Args:
+            key: Namespaced, normalized query.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.response
+
+    def get_similar(
+        self,
+        embedding: Sequence[float],
+        namespace: str = "",
+        literals: tuple[str, ...] = (),
+    ) -> Any | None:
+        """Return the cached response most similar to an embedding.
+
+        Args:
+            embedding: Embedding of the query template.
+            namespace: Only entries cached under this namespace are considered.
+            literals: Only entries whose query had exactly these literals are
+                considered.
+
+        Returns:
+            The best cached response at or above the similarity threshold, or
+            None if there is none.
+        """
+        self._evict_expired(time.monotonic())
+        query_vector = _unit_vector(embedding)
+
+        best_response = None
+        best_score = self.similarity_threshold
+        for entry in self._entries.values():
+            if (
+                entry.embedding is None
+                or entry.namespace != namespace
+                or entry.literals != literals
+            ):
+                continue
+            score = math.sumprod(query_vector, entry.embedding)
+            if score >= best_score:
+                best_response, best_score = entry.response, score
+        return best_response
+
+    def put(
+        self,
+        key: str,
+        response: Any,
+        embedding: Sequence[float] | None = None,
+        namespace: str = "",
+        literals: tuple[str, ...] = (),
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            key: Namespaced, normalized query.
+            response: Response to cache.
+            embedding: Optional embedding of the query template.
+            namespace: Namespace the entry belongs to.
+            literals: Literals of the query, matched exactly on semantic lookups.
+        """
+        self._entries[key] = _CacheEntry(
+            namespace=namespace,
+            expires_at=time.monotonic() + self.ttl,
+            embedding=_unit_vector(embedding) if embedding is not None else None,
+            literals=literals,
+            response=response,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+def semantic_cache(
+    ttl: float = 300,
+    maxsize: int = 256,
+    similarity_threshold: float = 0.97,
+    namespace: Callable[[], str] | None = None,
+    semantic: bool = False,
+):
+    """Decorator to cache an agent's ``execute_query`` responses.
+
+    Lookups first try an exact match on the normalized query. With
+    ``semantic=True`` and an agent ``embed_query`` coroutine that returns an
+    embedding, a miss then falls back to the most similar cached query with
+    identical literals. Error responses are not cached.
+
+    Args:
+        ttl: Seconds a cached response stays valid.
+        maxsize: Maximum number of cached responses.
+        similarity_threshold: Minimum cosine similarity for a semantic hit.
+        namespace: Optional callable returning a key prefix, e.g. a schema
+            version or time window. Changing its value invalidates old entries.
+        semantic: Whether to fall back to embedding similarity on a miss. This
+            costs one embedding request per miss.
+
+    Returns:
+        Decorator wrapping ``async def execute_query(self, query)``. The cache
+        is exposed on the wrapper as ``cache``.
+    """
+    cache = ResponseCache(ttl, maxsize, similarity_threshold)
+
+    def decorator(
+        func: Callable[[Any, str], Awaitable[Any]],
+    ) -> Callable[[Any, str], Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(self: Any, query: str) -> Any:
+            normalized = normalize_query(query)
+            current_namespace = namespace() if namespace else ""
+            key = f"{current_namespace}:{normalized}"
+
+            response = cache.get(key)
+            if response is not None:
+                logger.info("Response cache hit", match="exact", query=query)
+                return response
+
+            embedding = None
+            literals: tuple[str, ...] = ()
+            embed_query = getattr(self, "embed_query", None) if semantic else None
+            if embed_query is not None:
+                template, literals = split_literals(normalized)
+                embedding = await embed_query(template)
+            if embedding is not None:
+                response = cache.get_similar(embedding, current_namespace, literals)
+                if response is not None:
+                    logger.info("Response cache hit", match="semantic", query=query)
+                    return response
+
+            response = await func(self, query)
+            if not isinstance(response, QueryError):
+                cache.put(key, response, embedding, current_namespace, literals)
+            return response
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
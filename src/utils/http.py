@@ -0,0 +1,41 @@
+"""Shared HTTP clients for model providers.
+
+This module caches ``httpx.AsyncClient`` instances so that every agent talking
+to the same service reuses one connection pool.
+"""
+
+import httpx
+
+from src.config.settings import settings
+
+# Keyed by service identity, e.g. (endpoint, api_version).
+_client_cache: dict[tuple[str, ...], httpx.AsyncClient] = {}
+
+
+def get_http_client(*key: str) -> httpx.AsyncClient:
+    """Return the shared HTTP client for a service.
+
+    Args:
+        *key: Values identifying the service, such as endpoint and API version.
+
+    Returns:
+        httpx.AsyncClient: Cached client for the key, created if needed.
+    """
+    http_client = _client_cache.get(key)
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.httpx_max_connections,
+                max_keepalive_connections=settings.httpx_max_keepalive,
+            ),
+            timeout=60,
+        )
+        _client_cache[key] = http_client
+    return http_client
+
+
+async def aclose_http_clients() -> None:
+    """Close and forget all shared HTTP clients."""
+    while _client_cache:
+        _, http_client = _client_cache.popitem()
+        await http_client.aclose()
@@ -4,14 +4,16 @@ This module sets up structured logging with Logfire integration for
 comprehensive monitoring and debugging of the multi-cloud agent.
 """
 
+import functools
 import logging
 import uuid
 from contextvars import ContextVar
-from datetime import datetime
 from typing import Any
 
 import logfire
-from logfire import span
+from logfire import LevelName
+
+from src.models.responses import QueryResult
 
 # Initialize Logfire with automatic instrumentation
 logfire.configure(
@@ -30,15 +32,30 @@ logfire.instrument_asyncpg()
 request_id: ContextVar[str] = ContextVar("request_id", default="")
 correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
 
+# Logfire has its own level scale (info=9, error=17), so stdlib levels are
+# passed to it by name rather than number.
+_LOGFIRE_LEVEL_NAMES: dict[int, LevelName] = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "fatal",
+}
+
 
 class CloudAgentLogger:
     """Enhanced logger with Logfire integration.
 
+    Log calls are emitted as Logfire events attached to the current span
+    rather than opening spans of their own.
+
     Attributes:
-        logger: Base Python logger instance.
+        logger: Base Python logger instance, used for level filtering.
         default_extras: Default fields to include in all log messages.
     """
 
+    __slots__ = ("default_extras", "logger")
+
     def __init__(self, name: str, level: str = "INFO") -> None:
         """Initialize the logger with Logfire integration.
 
@@ -49,17 +66,7 @@ class CloudAgentLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
 
-        # Add Logfire handler
-        if not self.logger.handlers:
-            handler = logfire.LogfireHandler()
-            formatter = logfire.LogfireFormatter()
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-
-        self.default_extras = {
-            "service": "multi-cloud-agent",
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        self.default_extras = {"service": "multi-cloud-agent"}
 
     def _log(self, level: int, message: str, **kwargs: Any) -> None:
         """Internal logging method with Logfire context injection.
@@ -69,18 +76,14 @@ class CloudAgentLogger:
             message: Log message.
             **kwargs: Additional context to include in the log.
         """
-        with logfire.span(message) as span:
-            extras = {
-                **self.default_extras,
-                **kwargs,
-                "correlation_id": correlation_id.get(),
-                "request_id": request_id.get(),
-                "span_id": span.span_id,
-                "trace_id": span.trace_id,
-            }
-            self.logger.log(level, message, extra=extras)
-
-    @span("info_log")
+        if not self.logger.isEnabledFor(level):
+            return
+
+        extras = self.default_extras | kwargs
+        extras["correlation_id"] = correlation_id.get()
+        extras["request_id"] = request_id.get()
+        logfire.log(_LOGFIRE_LEVEL_NAMES[level], message, attributes=extras)
+
     def info(self, message: str, **kwargs: Any) -> None:
         """Log an info message with Logfire tracing.
 
@@ -90,7 +93,6 @@ class CloudAgentLogger:
         """
         self._log(logging.INFO, message, **kwargs)
 
-    @span("error_log")
     def error(
         self, message: str, error: Exception | None = None, **kwargs: Any
     ) -> None:
@@ -117,22 +119,40 @@ def with_logging(func):
     Returns:
         Wrapped function with Logfire tracing.
     """
+    # Messages are fixed per function, so format them once at decoration time.
+    start_message = f"Starting {func.__name__}"
+    complete_message = f"Completed {func.__name__}"
+    error_message = f"Error in {func.__name__}"
 
-    @logfire.span(func.__name__)
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        req_id = str(uuid.uuid4())
-        request_id.set(req_id)
-
-        logger = CloudAgentLogger(__name__)
-        logger.info(f"Starting {func.__name__}", request_id=req_id)
-
-        try:
-            result = await func(*args, **kwargs)
-            logger.info(f"Completed {func.__name__}", request_id=req_id)
-            return result
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}", error=e, request_id=req_id)
-            raise
+        # logfire.span is a context manager, not a decorator.
+        with logfire.span(func.__name__):
+            # Nested decorated calls share the outermost call's request ID.
+            req_id = request_id.get()
+            token = None
+            if not req_id:
+                req_id = uuid.uuid4().hex
+                token = request_id.set(req_id)
+
+            logger.info(start_message, request_id=req_id)
+
+            try:
+                result = await func(*args, **kwargs)
+                # Summarize query results rather than serializing every row.
+                summary = (
+                    {"source": result.source, "row_count": len(result.result)}
+                    if isinstance(result, QueryResult)
+                    else {}
+                )
+                logger.info(complete_message, request_id=req_id, **summary)
+                return result
+            except Exception as e:
+                logger.error(error_message, error=e, request_id=req_id)
+                raise
+            finally:
+                if token is not None:
+                    request_id.reset(token)
 
     return wrapper
 
@@ -0,0 +1,24 @@
+"""System prompt loading.
+
+This module loads agent system prompts from the text assets in ``src/prompts``
+and normalizes their whitespace so every request sends identical bytes.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+
+@lru_cache
+def load_prompt(name: str) -> str:
+    """Load a system prompt with all whitespace runs collapsed to single spaces.
+
+    Args:
+        name: Prompt file name without the ``.txt`` extension.
+
+    Returns:
+        str: Normalized prompt text.
+    """
+    text = (PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8")
+    return " ".join(text.split())
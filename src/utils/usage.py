@@ -0,0 +1,42 @@
+"""Token usage helpers for agent runs.
+
+This module extracts provider prompt-cache statistics from PydanticAI run
+results so they can be logged.
+"""
+
+from typing import Any
+
+from pydantic_ai.result import RunResult
+
+from src.utils.logging import logger
+
+# Usage detail keys reported for cached prompt tokens by each provider.
+CACHED_TOKEN_KEYS = ("cached_tokens", "cached_content_token_count")
+
+
+def cache_read_input_tokens(result: RunResult[Any]) -> int:
+    """Return the number of prompt tokens served from the provider cache.
+
+    Args:
+        result: Completed PydanticAI run result.
+
+    Returns:
+        int: Cached prompt tokens, or 0 if the provider did not report any.
+    """
+    details = result.usage().details or {}
+    return sum(details.get(key, 0) for key in CACHED_TOKEN_KEYS)
+
+
+def log_cache_usage(result: RunResult[Any]) -> None:
+    """Log how many prompt tokens a run served from the provider cache.
+
+    The statistic is kept out of the response models because they double as
+    the LLM's output schema.
+
+    Args:
+        result: Completed PydanticAI run result.
+    """
+    logger.info(
+        "Agent prompt cache usage",
+        cache_read_input_tokens=cache_read_input_tokens(result),
+    )
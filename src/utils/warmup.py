@@ -0,0 +1,44 @@
+"""Startup warmup for agent connections.
+
+This module provides the guard that lets agents open connections and fetch
+credentials before their first query.
+"""
+
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.utils.logging import logger
+
+
+def warmup_once(service: str):
+    """Decorator making an agent's ``warmup`` coroutine idempotent and non-fatal.
+
+    The wrapped coroutine runs until it first succeeds, tracked by the agent's
+    ``_warmed_up`` attribute. Failures are logged rather than raised, leaving
+    the first query to connect as usual.
+
+    Args:
+        service: Service name included in failure logs.
+
+    Returns:
+        Decorator wrapping ``async def warmup(self)``.
+    """
+
+    def decorator(
+        func: Callable[[Any], Awaitable[None]],
+    ) -> Callable[[Any], Awaitable[None]]:
+        @functools.wraps(func)
+        async def wrapper(self: Any) -> None:
+            if self._warmed_up:
+                return
+            try:
+                await func(self)
+            except Exception as e:
+                logger.error("Warmup failed", service=service, error=e)
+            else:
+                self._warmed_up = True
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,13 @@
+"""Shared test configuration.
+
+Settings are read when agent and tool modules are imported, so placeholder
+values are provided for the required environment variables.
+"""
+
+import os
+
+os.environ.setdefault("AZURE_OPENAI_DEPLOYMENT_NAME", "test-deployment")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com")
+os.environ.setdefault("AZURE_SQL_CONNECTION_STRING", "Driver=test")
+os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
@@ -0,0 +1,147 @@
+"""Tests for the Azure OpenAI agent's batch execution."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+import pytest
+from openai.types import Batch
+from openai.types.batch import Errors
+from openai.types.batch_error import BatchError
+
+from src.agents.azure_agent import azure_agent
+from src.config.settings import get_settings
+from src.models.responses import QueryError
+
+
+def make_batch(status: str = "completed", **fields: Any) -> Batch:
+    """Build a Batch API job in the given state."""
+    return Batch(
+        id="batch-1",
+        object="batch",
+        endpoint="/chat/completions",
+        input_file_id="input",
+        completion_window="24h",
+        created_at=0,
+        status=status,
+        **fields,
+    )
+
+
+def jsonl(*records: dict[str, Any]) -> SimpleNamespace:
+    """Wrap records as a ``files.content`` response."""
+    return SimpleNamespace(content=b"\n".join(map(orjson.dumps, records)) + b"\n")
+
+
+class FakeBatchClient:
+    """Azure OpenAI client stub serving one batch job and its files."""
+
+    def __init__(self, batch: Batch, files: dict[str, SimpleNamespace]) -> None:
+        """Store the batch job and file contents to return."""
+        self.uploads: list[bytes] = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch)
+        self._batch = batch
+        self._files = files
+
+    async def _create_file(self, file: tuple[str, bytes], purpose: str) -> Any:
+        self.uploads.append(file[1])
+        return SimpleNamespace(id="input")
+
+    async def _content(self, file_id: str) -> SimpleNamespace:
+        return self._files[file_id]
+
+    async def _create_batch(self, **kwargs: Any) -> Batch:
+        return self._batch
+
+
+@pytest.fixture
+def batch_deployment(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Configure a Global-Batch deployment for the test."""
+    monkeypatch.setenv("AZURE_OPENAI_BATCH_DEPLOYMENT", "gpt-4o-batch")
+    get_settings.cache_clear()
+    yield "gpt-4o-batch"
+    get_settings.cache_clear()
+
+
+async def test_execute_batch_maps_output_and_error_files(
+    monkeypatch: pytest.MonkeyPatch, batch_deployment: str
+) -> None:
+    """Results follow query order and failed items carry the provider error."""
+    client = FakeBatchClient(
+        make_batch(output_file_id="output", error_file_id="errors"),
+        {
+            "output": jsonl(
+                {
+                    "custom_id": "0",
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": "ok"}}]},
+                    },
+                    "error": None,
+                }
+            ),
+            "errors": jsonl(
+                {
+                    "custom_id": "1",
+                    "response": {
+                        "status_code": 400,
+                        "body": {"error": {"message": "bad prompt"}},
+                    },
+                    "error": None,
+                },
+                {
+                    "custom_id": "2",
+                    "response": None,
+                    "error": {"code": "timeout", "message": "timed out"},
+                },
+            ),
+        },
+    )
+    monkeypatch.setattr(azure_agent, "client", client)
+
+    results = await azure_agent.execute_batch(["q0", "q1", "q2", "q3"])
+
+    assert results[0] == "ok"
+    assert [result.error_message for result in results[1:]] == [
+        "bad prompt",
+        "timed out",
+        "No response returned by batch",
+    ]
+    assert all(isinstance(result, QueryError) for result in results[1:])
+    requests = [orjson.loads(line) for line in client.uploads[0].splitlines()]
+    assert {request["body"]["model"] for request in requests} == {batch_deployment}
+
+
+async def test_execute_batch_reports_batch_errors(
+    monkeypatch: pytest.MonkeyPatch, batch_deployment: str
+) -> None:
+    """A batch that fails as a whole raises with its batch-level errors."""
+    errors = Errors(data=[BatchError(code="invalid_file", message="bad jsonl")])
+    client = FakeBatchClient(make_batch("failed", errors=errors), {})
+    monkeypatch.setattr(azure_agent, "client", client)
+
+    with pytest.raises(RuntimeError, match="bad jsonl"):
+        await azure_agent.execute_batch(["q0"])
+
+
+async def test_execute_batch_skips_empty_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No batch job is submitted when there is nothing to run."""
+    client = FakeBatchClient(make_batch(), {})
+    monkeypatch.setattr(azure_agent, "client", client)
+
+    assert await azure_agent.execute_batch([]) == []
+    assert client.uploads == []
+
+
+async def test_execute_batch_requires_batch_deployment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batch jobs are not sent to the interactive deployment."""
+    monkeypatch.delenv("AZURE_OPENAI_BATCH_DEPLOYMENT", raising=False)
+    get_settings.cache_clear()
+    monkeypatch.setattr(azure_agent, "client", FakeBatchClient(make_batch(), {}))
+
+    with pytest.raises(RuntimeError, match="azure_openai_batch_deployment"):
+        await azure_agent.execute_batch(["q0"])
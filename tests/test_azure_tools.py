@@ -0,0 +1,202 @@
+"""Tests for the Azure SQL tools."""
+
+import asyncio
+import decimal
+from collections.abc import Iterator
+
+import pytest
+
+# pyodbc needs the unixODBC driver manager, which may not be installed.
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+import pyarrow as pa
+
+from src.config.settings import get_settings
+from src.tools import azure_tools
+from src.tools.azure_tools import AzureSQLTools
+
+
+def column(name: str, type_code: type, precision: int = 0, scale: int = 0) -> tuple:
+    """Build a ``cursor.description`` entry."""
+    return (name, type_code, None, None, precision, scale, True)
+
+
+class FakeCursor:
+    """Cursor stub returning canned rows."""
+
+    def __init__(self, description: list[tuple], rows: list[tuple]) -> None:
+        """Store the result set to return."""
+        self.description = description
+        self.rows = list(rows)
+        self.closed = False
+
+    def execute(self, query: str) -> None:
+        """Accept any query."""
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        """Return the next ``size`` rows."""
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+        return chunk
+
+    def close(self) -> None:
+        """Mark the cursor closed."""
+        self.closed = True
+
+
+class FakeConnection:
+    """Connection stub handing out one cursor."""
+
+    def __init__(
+        self, cursor: FakeCursor | None = None, fail_rollback: bool = False
+    ) -> None:
+        """Store the cursor to return."""
+        self._cursor = cursor
+        self.fail_rollback = fail_rollback
+        self.rollbacks = 0
+        self.closed = False
+
+    def cursor(self) -> FakeCursor:
+        """Return the canned cursor."""
+        return self._cursor
+
+    def rollback(self) -> None:
+        """Count rollbacks, failing if configured to."""
+        self.rollbacks += 1
+        if self.fail_rollback:
+            raise RuntimeError("connection lost")
+
+    def close(self) -> None:
+        """Mark the connection closed."""
+        self.closed = True
+
+
+@pytest.fixture
+def pool_size(monkeypatch: pytest.MonkeyPatch) -> Iterator[int]:
+    """Limit the connection pool to one connection."""
+    monkeypatch.setenv("AZURE_SQL_POOL_SIZE", "1")
+    get_settings.cache_clear()
+    yield 1
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def connect(monkeypatch: pytest.MonkeyPatch) -> list[FakeConnection]:
+    """Route ``pyodbc.connect`` to queued fake connections."""
+    connections: list[FakeConnection] = []
+    opened = iter(connections)
+    monkeypatch.setattr(azure_tools.pyodbc, "connect", lambda _: next(opened))
+    return connections
+
+
+async def test_stream_query_batches_share_schema(
+    connect: list[FakeConnection],
+) -> None:
+    """An all-NULL first chunk does not change the schema of later batches."""
+    cursor = FakeCursor(
+        [column("id", int), column("name", str)], [(1, None), (2, None), (3, "x")]
+    )
+    connect.append(FakeConnection(cursor))
+
+    batches = [batch async for batch in AzureSQLTools().stream_query("q", batch_size=2)]
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema == batches[1].schema
+    assert batches[0].schema.field("name").type == pa.string()
+    table = pa.Table.from_batches(batches)
+    assert table.column("name").to_pylist() == [None, None, "x"]
+    assert cursor.closed
+
+
+async def test_execute_query_arrow_keeps_schema_for_empty_result(
+    connect: list[FakeConnection],
+) -> None:
+    """Column types come from the cursor description, not the rows."""
+    cursor = FakeCursor(
+        [column("id", int), column("total", decimal.Decimal, 10, 2)], []
+    )
+    connect.append(FakeConnection(cursor))
+
+    table = await AzureSQLTools().execute_query_arrow("q")
+
+    assert table.num_rows == 0
+    assert table.schema == pa.schema(
+        [pa.field("id", pa.int64()), pa.field("total", pa.decimal128(10, 2))]
+    )
+
+
+async def test_get_connection_reuses_rolled_back_connection(
+    connect: list[FakeConnection],
+) -> None:
+    """Connections are rolled back and returned to the pool after use."""
+    connect.append(FakeConnection())
+    tools = AzureSQLTools()
+
+    async with tools.get_connection() as first:
+        pass
+    async with tools.get_connection() as second:
+        pass
+
+    assert first is second
+    assert first.rollbacks == 2
+    assert not first.closed
+
+
+async def test_get_connection_closes_connection_on_error(
+    connect: list[FakeConnection],
+) -> None:
+    """A connection the caller raised with is closed instead of pooled."""
+    connect.extend([FakeConnection(), FakeConnection()])
+    tools = AzureSQLTools()
+
+    with pytest.raises(ValueError):
+        async with tools.get_connection():
+            raise ValueError("query failed")
+    async with tools.get_connection() as connection:
+        pass
+
+    assert connect[0].closed
+    assert connection is connect[1]
+
+
+async def test_get_connection_closes_connection_when_rollback_fails(
+    connect: list[FakeConnection],
+) -> None:
+    """A connection that cannot be reset is not returned to the pool."""
+    connect.append(FakeConnection(fail_rollback=True))
+    tools = AzureSQLTools()
+
+    async with tools.get_connection():
+        pass
+
+    assert connect[0].closed
+    assert tools.connection_pool.empty()
+
+
+async def test_get_connection_limits_checked_out_connections(
+    pool_size: int, connect: list[FakeConnection]
+) -> None:
+    """Callers wait for a free slot once pool_size connections are in use."""
+    connect.append(FakeConnection())
+    tools = AzureSQLTools()
+
+    second = tools.get_connection()
+    async with tools.get_connection():
+        waiter = asyncio.create_task(second.__aenter__())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+    assert await waiter is connect[0]
+    await second.__aexit__(None, None, None)
+
+
+async def test_close_closes_idle_connections(connect: list[FakeConnection]) -> None:
+    """Closing the tools closes every pooled connection."""
+    connect.append(FakeConnection())
+    tools = AzureSQLTools()
+    async with tools.get_connection():
+        pass
+
+    await tools.close()
+
+    assert connect[0].closed
+    assert tools.connection_pool.empty()
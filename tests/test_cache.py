@@ -0,0 +1,180 @@
+"""Tests for the agent response cache."""
+
+from typing import Any
+
+import pytest
+
+from src.models.responses import QueryError
+from src.utils import cache as cache_module
+from src.utils.cache import ResponseCache, semantic_cache, split_literals
+
+
+class FakeClock:
+    """Monotonic clock advanced manually by tests."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the cache's monotonic clock with a fake one."""
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+def test_get_returns_response_until_ttl_expires(clock: FakeClock) -> None:
+    """Entries expire once their TTL has elapsed."""
+    cache = ResponseCache(ttl=10)
+    cache.put("q", "response")
+
+    clock.now += 9.9
+    assert cache.get("q") == "response"
+
+    clock.now += 0.1
+    assert cache.get("q") is None
+
+
+def test_put_evicts_least_recently_used(clock: FakeClock) -> None:
+    """The least recently used entry is evicted when the cache is full."""
+    cache = ResponseCache(ttl=10, maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_similar_respects_threshold(clock: FakeClock) -> None:
+    """Semantic hits require the similarity threshold."""
+    cache = ResponseCache(ttl=10, similarity_threshold=0.97)
+    cache.put("q", "response", embedding=[1.0, 0.0])
+
+    assert cache.get_similar([0.99, 0.1]) == "response"
+    assert cache.get_similar([0.7, 0.7]) is None
+
+
+def test_get_similar_isolates_namespaces(clock: FakeClock) -> None:
+    """Semantic hits only come from the same namespace."""
+    cache = ResponseCache(ttl=10)
+    cache.put("v1:q", "response", embedding=[1.0, 0.0], namespace="v1")
+
+    assert cache.get_similar([1.0, 0.0], namespace="v1") == "response"
+    assert cache.get_similar([1.0, 0.0], namespace="v2") is None
+
+
+def test_get_similar_requires_equal_literals(clock: FakeClock) -> None:
+    """Semantic hits require identical query literals."""
+    cache = ResponseCache(ttl=10)
+    cache.put("q", "response", embedding=[1.0, 0.0], literals=("'EU'",))
+
+    assert cache.get_similar([1.0, 0.0], literals=("'EU'",)) == "response"
+    assert cache.get_similar([1.0, 0.0], literals=("'US'",)) is None
+
+
+def test_get_similar_skips_expired_entries(clock: FakeClock) -> None:
+    """Expired entries are never semantic hits."""
+    cache = ResponseCache(ttl=10)
+    cache.put("q", "response", embedding=[1.0, 0.0])
+
+    clock.now += 10
+    assert cache.get_similar([1.0, 0.0]) is None
+
+
+def test_split_literals() -> None:
+    """String and numeric literals are replaced by placeholders."""
+    template, literals = split_literals(
+        "SELECT * FROM t2 WHERE name = 'O''Brien' AND total > 1.5"
+    )
+
+    assert template == "SELECT * FROM t2 WHERE name = ? AND total > ?"
+    assert literals == ("'O''Brien'", "1.5")
+
+
+class FakeAgent:
+    """Agent stub recording calls to ``execute_query`` and ``embed_query``."""
+
+    def __init__(self) -> None:
+        """Start with no recorded calls."""
+        self.queries: list[str] = []
+        self.embedded: list[str] = []
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Record the query and return a fixed embedding."""
+        self.embedded.append(query)
+        return [1.0, 0.0]
+
+    async def execute_query(self, query: str) -> str | QueryError:
+        """Record the query and return a canned response."""
+        self.queries.append(query)
+        if "fail" in query:
+            return QueryError(error_message="boom", source="test", query=query)
+        return f"result for {query}"
+
+
+def make_agent(**cache_options: Any) -> FakeAgent:
+    """Build a fake agent whose execute_query is cached."""
+    agent = FakeAgent()
+    cached = semantic_cache(**cache_options)(FakeAgent.execute_query)
+    agent.execute_query = cached.__get__(agent)
+    return agent
+
+
+async def test_exact_hit_ignores_whitespace(clock: FakeClock) -> None:
+    """Queries differing only in whitespace share an exact entry."""
+    agent = make_agent(ttl=10)
+
+    first = await agent.execute_query("SELECT  1")
+    second = await agent.execute_query(" SELECT 1 ")
+
+    assert first == second
+    assert agent.queries == ["SELECT  1"]
+
+
+async def test_semantic_lookup_is_opt_in(clock: FakeClock) -> None:
+    """No embeddings are requested unless semantic lookups are enabled."""
+    agent = make_agent(ttl=10)
+
+    await agent.execute_query("SELECT 1")
+    await agent.execute_query("SELECT 2")
+
+    assert agent.embedded == []
+    assert agent.queries == ["SELECT 1", "SELECT 2"]
+
+
+async def test_semantic_lookup_matches_template_and_literals(clock: FakeClock) -> None:
+    """Semantic hits match the literal-free template with equal literals."""
+    agent = make_agent(ttl=10, semantic=True)
+
+    await agent.execute_query("SELECT * FROM t WHERE region = 'EU'")
+    await agent.execute_query("select * from t where region = 'EU'")
+    await agent.execute_query("SELECT * FROM t WHERE region = 'US'")
+
+    assert agent.embedded == [
+        "SELECT * FROM t WHERE region = ?",
+        "select * from t where region = ?",
+        "SELECT * FROM t WHERE region = ?",
+    ]
+    assert agent.queries == [
+        "SELECT * FROM t WHERE region = 'EU'",
+        "SELECT * FROM t WHERE region = 'US'",
+    ]
+
+
+async def test_errors_are_not_cached(clock: FakeClock) -> None:
+    """Error responses are not cached."""
+    agent = make_agent(ttl=10)
+
+    await agent.execute_query("fail")
+    await agent.execute_query("fail")
+
+    assert agent.queries == ["fail", "fail"]
@@ -0,0 +1,30 @@
+"""Tests for the Logfire-backed logger."""
+
+from logfire.testing import CaptureLogfire
+
+from src.utils.logging import logger, with_logging
+
+
+def test_log_levels_use_logfire_scale(capfire: CaptureLogfire) -> None:
+    """Info and error lines are exported at Logfire's own level numbers."""
+    logger.info("hello")
+    logger.error("boom", error=ValueError("bad"))
+
+    levels = {
+        span["name"]: span["attributes"]["logfire.level_num"]
+        for span in capfire.exporter.exported_spans_as_dict()
+    }
+    assert levels == {"hello": 9, "boom": 17}
+
+
+async def test_with_logging_wraps_call_in_span(capfire: CaptureLogfire) -> None:
+    """Decorated coroutines run inside a span named after the function."""
+
+    @with_logging
+    async def fetch_rows() -> int:
+        return 3
+
+    assert await fetch_rows() == 3
+
+    spans = capfire.exporter.exported_spans_as_dict()
+    assert "fetch_rows" in {span["name"] for span in spans}